@@ -1,17 +1,37 @@
 import re
 import json
+import mmap
+import os
+import stat
 import sys
+from functools import lru_cache
 from html import escape
-from urllib.parse import urlparse
 
-def parse_size(size_str):
+CRITICAL_EXTENSIONS = [
+    '.sql', '.db', '.sqlite', '.mdb', '.accdb',    # Database Files
+    '.pwd', '.key',                                 # Password Files
+    '.kdbx', '.psafe3',                             # Password Manager Files
+    '.bak', '.backup', '.old'                       # Backup and Archive Files
+]
+CRITICAL_NAMES = ['database', 'db', 'sql', 'password']
+
+# Extensions without their leading dot, compared against the part after a filename's last '.'
+CRITICAL_EXTENSION_LOOKUP = frozenset(ext.lstrip('.') for ext in CRITICAL_EXTENSIONS)
+# Names can appear anywhere in a filename, so they stay a single regex alternation
+CRITICAL_NAME_RE = re.compile('|'.join(re.escape(name) for name in CRITICAL_NAMES))
+
+# A 200 response line: status, method, lines, words, size, then the URL as the last field.
+# The byte count is the first run of digits followed by 'c' anywhere in the size field (e.g. '1234c');
+# a size field without one still matches, with no byte count.
+FEROX_LINE_RE = re.compile(
+    rb'^[ \t]*200[ \t]+\S+[ \t]+\S+[ \t]+\S+[ \t]+(?:\S*?(\d+)c\S*|\S+)(?:[ \t]+\S+)*?[ \t]+(\S+)[ \t\r]*$',
+    re.MULTILINE,
+)
+
+def format_size(bytes_size):
     """
-    Parses the size string from the feroxbuster output and converts it into a human-readable format.
+    Converts a size in bytes from the feroxbuster output into a human-readable format.
     """
-    match = re.search(r'(\d+)c', size_str)
-    if not match:
-        return ''
-    bytes_size = int(match.group(1))
     if bytes_size < 1024:
         return f"{bytes_size} B"
     elif bytes_size < 1024 * 1024:
@@ -19,151 +39,190 @@ def parse_size(size_str):
     else:
         return f"{(bytes_size / (1024 * 1024)):.1f} MB"
 
-def parse_ferox_line(line, base_url):
+def url_path(url):
     """
-    Parses each line of the feroxbuster output to extract relevant information.
+    Returns the path of a URL relative to its host, without the leading slash, query or fragment.
     """
-    parts = line.strip().split()
-    if len(parts) < 6:
-        return None
-    if parts[0] != '200':
-        return None
-    full_url = parts[-1]
-    if full_url.startswith(base_url):
-        path = full_url.replace(base_url, '', 1)
-    else:
-        # Extract the path component from the URL
-        parsed_url = urlparse(full_url)
-        path = parsed_url.path
-    size = parse_size(parts[4])
-    return path, size
-
-def deduplicate_files(files):
+    before, scheme_sep, rest = url.partition('://')
+    # The query and fragment are never part of the path
+    rest = (rest if scheme_sep else before).partition('#')[0].partition('?')[0]
+    if scheme_sep:
+        # Everything after the host's first '/' is the path
+        rest = rest.partition('/')[2]
+    return rest.lstrip('/')
+
+def parse_ferox_output(data, base_url):
+    """
+    Scans the raw feroxbuster output and yields the path and size of every 200 response.
     """
-    Deduplicate files ignoring case but preserving original case for display.
+    base_url_length = len(base_url)
+    for match in FEROX_LINE_RE.finditer(data):
+        full_url = match.group(2).decode('utf-8', errors='replace')
+        if full_url.startswith(base_url):
+            path = full_url[base_url_length:]
+        else:
+            # Extract the path component from the URL, relative like the stripped paths above
+            path = url_path(full_url)
+        digits = match.group(1)
+        yield path, format_size(int(digits)) if digits is not None else ''
+
+def collect_files(data, base_url):
     """
-    deduplicated = {}
-    for path, size in files.items():
+    Collects the 200 responses from the raw feroxbuster output, deduplicated ignoring case.
+    Returns a dict mapping each lowercased path to its display path and size, and the number of duplicates dropped.
+    """
+    files = {}
+    duplicates = 0
+    # Only 200 responses are reported, so one regex pass over the whole file picks out their sizes and URLs
+    for path, size in parse_ferox_output(data, base_url):
         lower_path = path.lower()
-        if lower_path not in deduplicated or path.isupper():
-            deduplicated[lower_path] = (path, size)
-    return {original_path: size for lower_path, (original_path, size) in deduplicated.items()}
+        existing = files.get(lower_path)
+        if existing is None:
+            files[lower_path] = (path, size)
+        else:
+            duplicates += 1
+            # An all-uppercase spelling wins for display; repeats of the kept spelling update its size
+            if path.isupper() or path == existing[0]:
+                files[lower_path] = (path, size)
+    return files, duplicates
+
+@lru_cache(maxsize=8192)
+def is_critical_filename(filename):
+    """
+    Checks a lowercase filename against the critical extensions and names.
+    Cached because the same filenames (index.php, config.bak, ...) recur across directories.
+    """
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot and extension in CRITICAL_EXTENSION_LOOKUP) or CRITICAL_NAME_RE.search(filename) is not None
 
 def categorize_critical_files(files):
     """
     Categorize files into Critical based on predefined criteria.
+    files maps each lowercased path to its display path and size.
     """
-    critical_extensions = [
-        '.sql', '.db', '.sqlite', '.mdb', '.accdb',    # Database Files
-        '.pwd', '.key',                                 # Password Files
-        '.kdbx', '.psafe3',                             # Password Manager Files
-        '.bak', '.backup', '.old'                       # Backup and Archive Files
-    ]
-    critical_names = ['database', 'db', 'sql', 'password']
-
     categorized = []
 
-    for path, size in files.items():
-        filename = path.split('/')[-1].lower()
-        # Check extensions
-        if any(filename.endswith(ext) for ext in critical_extensions):
-            categorized.append({'path': path, 'size': size})
-            continue
-        # Check specific names
-        if any(name in filename for name in critical_names):
+    for lower_path, (path, size) in files.items():
+        if is_critical_filename(lower_path.rpartition('/')[2]):
             categorized.append({'path': path, 'size': size})
-            continue
 
     return categorized
 
+class TreeNode:
+    """
+    A single directory or file in the tree built by build_tree.
+    """
+    __slots__ = ('name', 'size', 'is_critical', 'children')
+
+    def __init__(self, name, size=None, is_critical=False):
+        self.name = name
+        self.size = size
+        self.is_critical = is_critical
+        # Most nodes are files, so the children dict is only created once a first child is added
+        self.children = None
+
+    def to_dict(self):
+        # Walk with an explicit stack so deep paths cannot hit the recursion limit; each node's dict
+        # is created in its parent's children list first and filled in when the node is popped
+        result = {}
+        stack = [(self, result)]
+        while stack:
+            node, node_dict = stack.pop()
+            node_dict["name"] = node.name
+            if node.size:
+                node_dict["size"] = node.size
+            if node.is_critical:
+                node_dict["is_critical"] = node.is_critical
+            if node.children is not None:
+                child_dicts = node_dict["children"] = []
+                # Children are keyed by their lowercased name, so sorting the keys avoids lowering every name again
+                for _, child in sorted(node.children.items()):
+                    child_dict = {}
+                    child_dicts.append(child_dict)
+                    stack.append((child, child_dict))
+        return result
+
 def build_tree(files, critical_files):
     """
     Constructs a nested dictionary representing the directory tree from the list of files.
+    files maps each lowercased path to its display path and size.
     Critical files are marked for highlighting.
     """
-    class TreeNode:
-        def __init__(self, name, size=None, is_critical=False):
-            self.name = name
-            self.size = size
-            self.is_critical = is_critical
-            self.children = {}
-
-        def to_dict(self):
-            result = {"name": self.name}
-            if self.size:
-                result["size"] = self.size
-            if self.is_critical:
-                result["is_critical"] = self.is_critical
-            if self.children:
-                result["children"] = [child.to_dict() for child in sorted(self.children.values(), key=lambda x: x.name.lower())]
-            return result
-
-    # Create a set for quick critical file lookup
-    critical_set = set(item['path'].lower() for item in critical_files)
+    # Create a set for quick critical file lookup, matched against the already-lowercased file keys
+    critical_set = frozenset(item['path'].lower() for item in critical_files)
 
     root = TreeNode("")
+    # Local aliases for the hot loop below
+    intern = sys.intern
+    node_class = TreeNode
 
-    files = deduplicate_files(files)
-
-    for path, size in sorted(files.items(), key=lambda x: x[0].lower()):
+    # The keys are already lowercase, so they sort case-insensitively without a key function
+    for lower_path, (path, size) in sorted(files.items()):
         current = root
         parts = path.strip('/').split('/')
-        for i, part in enumerate(parts):
-            lower_part = part.lower()
-            if lower_part not in current.children:
-                # Determine if the current part is a critical file
-                if i == len(parts) - 1:
-                    is_critical = path.lower() in critical_set
-                else:
-                    is_critical = False
-                current.children[lower_part] = TreeNode(part, size if i == len(parts) - 1 else None, is_critical)
-            current = current.children[lower_part]
+        lower_parts = lower_path.strip('/').split('/')
+        # Only the last part is a file, so only it carries a size and can be critical
+        name = parts.pop()
+        lower_name = lower_parts.pop()
+        for part, lower_part in zip(parts, lower_parts):
+            children = current.children
+            if children is None:
+                children = current.children = {}
+            child = children.get(lower_part)
+            if child is None:
+                # Names like 'css' or 'index.php' repeat across directories, so share one string per name and key
+                child = children[intern(lower_part)] = node_class(intern(part))
+            current = child
+        children = current.children
+        if children is None:
+            children = current.children = {}
+        if lower_name not in children:
+            children[intern(lower_name)] = node_class(intern(name), size, lower_path in critical_set)
     return root.to_dict()
 
-def generate_html(tree_data, critical_files, base_url):
-    """
-    Generates an interactive HTML report based on the directory tree data and critical files.
-    """
-    # Escape double braces for JavaScript template literals
-    return f"""<!DOCTYPE html>
+# Static markup for the report, written around the dynamic sections by generate_html
+REPORT_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Directory Structure Report</title>
     <style>
-        body {{
+"""
+
+# Static stylesheet for the report, kept out of the f-strings so it needs no brace escaping
+REPORT_CSS = """        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background-color: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #333;
             margin-bottom: 20px;
-        }}
-        .tree-node {{
+        }
+        .tree-node {
             margin-left: 20px;
-        }}
-        .node-content {{
+        }
+        .node-content {
             display: flex;
             align-items: center;
             padding: 4px;
             border-radius: 4px;
-        }}
-        .node-content:hover {{
+        }
+        .node-content:hover {
             background-color: #f0f0f0;
-        }}
-        .expander {{
+        }
+        .expander {
             cursor: pointer;
             width: 20px;
             height: 20px;
@@ -172,8 +231,8 @@ def generate_html(tree_data, critical_files, base_url):
             justify-content: center;
             margin-right: 5px;
             font-family: monospace;
-        }}
-        .checkbox {{
+        }
+        .checkbox {
             width: 16px;
             height: 16px;
             margin-right: 8px;
@@ -183,31 +242,31 @@ def generate_html(tree_data, critical_files, base_url):
             justify-content: center;
             border: 1px solid #ccc;
             border-radius: 3px;
-        }}
-        .checkbox.red-x {{
+        }
+        .checkbox.red-x {
             color: red;
             font-weight: bold;
-        }}
-        .checkbox.green-check {{
+        }
+        .checkbox.green-check {
             color: green;
             font-weight: bold;
-        }}
-        .icon {{
+        }
+        .icon {
             margin-right: 5px;
             font-family: monospace;
-        }}
-        .node-name {{
+        }
+        .node-name {
             flex-grow: 1;
-        }}
-        .size {{
+        }
+        .size {
             color: #666;
             font-size: 0.9em;
             margin-left: 8px;
-        }}
-        .file-extension {{
+        }
+        .file-extension {
             font-weight: bold;
-        }}
-        .tracked-files {{
+        }
+        .tracked-files {
             position: fixed;
             top: 20px;
             right: 20px;
@@ -220,70 +279,78 @@ def generate_html(tree_data, critical_files, base_url):
             box-shadow: 0 2px 8px rgba(0,0,0,0.2);
             display: none;
             z-index: 1000;
-        }}
-        .tracked-files.visible {{
+        }
+        .tracked-files.visible {
             display: block;
-        }}
-        .tracked-item {{
+        }
+        .tracked-item {
             padding: 4px 0;
             border-bottom: 1px solid #eee;
-        }}
-        .instructions {{
+        }
+        .instructions {
             background-color: #f8f9fa;
             padding: 15px;
             border-radius: 6px;
             margin-bottom: 20px;
-        }}
-        .instructions ul {{
+        }
+        .instructions ul {
             margin: 10px 0;
             padding-left: 20px;
-        }}
-        a {{
+        }
+        a {
             color: inherit;
             text-decoration: none;
-        }}
-        a:hover {{
+        }
+        a:hover {
             color: #0366d6;
-        }}
+        }
         /* Highlighting Styles */
-        .highlight-critical {{
+        .highlight-critical {
             box-shadow: 0 0 10px 2px red;
-        }}
+        }
         /* Category Box */
-        .category-box {{
+        .category-box {
             padding: 10px;
             border-radius: 6px;
             margin-bottom: 20px;
             color: white;
             background-color: #e74c3c; /* Red */
-        }}
-        .category-box h2 {{
+        }
+        .category-box h2 {
             margin-top: 0;
-        }}
-        .category-list a {{
+        }
+        .category-list a {
             display: block;
             color: white;
             text-decoration: underline;
             margin: 2px 0;
-        }}
-        .category-list a:hover {{
+        }
+        .category-list a:hover {
             text-decoration: none;
-        }}
-    </style>
+        }
+"""
+
+REPORT_SUMMARY_OPEN = """    </style>
 </head>
 <body>
     <div class="container">
         <h1>Directory Structure Report</h1>
         <!-- Critical Files Summary Box -->
         <div class="category-summary">
-            {f'''
+            """
+
+CRITICAL_BOX_OPEN = """
             <div class="category-box">
                 <h2>Critical Files</h2>
                 <div class="category-list">
-                    {''.join([f'<a href="{escape(base_url + "/" + item["path"])}" target="_blank">{escape(item["path"])}</a>' for item in critical_files])}
+                    """
+
+CRITICAL_BOX_CLOSE = """
                 </div>
             </div>
-            ''' if critical_files else ''}
+            """
+
+REPORT_BODY = """
         </div>
         <div class="instructions">
             <p>👉 Click directory checkboxes to mark status:</p>
@@ -302,46 +369,42 @@ def generate_html(tree_data, critical_files, base_url):
     </div>
 
     <script>
-        const treeData = {json.dumps(tree_data)};
-        const criticalFiles = {json.dumps([item['path'].lower() for item in critical_files])};
-
-        function formatFileName(name) {{
-            const parts = name.split('.');
-            if (parts.length <= 1) return name;
-            return `${{parts.slice(0, -1).join('.')}}<span class="file-extension">.${{parts.pop()}}</span>`;
-        }}
-
-        function updateTrackedFiles() {{
-            const trackedFiles = [];
-            document.querySelectorAll('.checkbox[data-state="2"]').forEach(checkbox => {{
-                const nodeContent = checkbox.closest('.node-content');
-                const name = nodeContent.querySelector('.node-name').textContent;
-                const size = nodeContent.querySelector('.size')?.textContent || '';
-                const path = nodeContent.querySelector('a')?.href || '';
-                const isDirectory = nodeContent.querySelector('.icon').textContent.includes('📁');
-                trackedFiles.push({{ name, size, path, isDirectory }});
-            }});
+        const treeData = """
+
+# Static script and closing markup, written after the tree data and base URL
+REPORT_SCRIPT = """
+        function formatFileName(name) {
+            const dot = name.lastIndexOf('.');
+            if (dot === -1) return name;
+            return `${name.slice(0, dot)}<span class="file-extension">${name.slice(dot)}</span>`;
+        }
+
+        function updateTrackedFiles() {
+            const trackedFiles = Array.from(
+                document.querySelectorAll('.checkbox[data-state="2"]'),
+                checkbox => checkbox.trackedFile
+            );
 
             const trackedFilesPanel = document.getElementById('tracked-files');
             const trackedList = document.getElementById('tracked-list');
             const trackedCount = document.getElementById('tracked-count');
 
-            if (trackedFiles.length > 0) {{
+            if (trackedFiles.length > 0) {
                 trackedFilesPanel.classList.add('visible');
                 trackedCount.textContent = trackedFiles.length;
                 trackedList.innerHTML = trackedFiles.map(file => `
                     <div class="tracked-item">
-                        <span>${{file.isDirectory ? '📁' : '📄'}}</span>
-                        <a href="${{file.path}}" target="_blank">${{file.name}}</a>
-                        ${{file.size ? `<span class="size">${{file.size}}</span>` : ''}}
+                        <span>${file.isDirectory ? '📁' : '📄'}</span>
+                        <a href="${file.path}" target="_blank">${file.name}</a>
+                        ${file.size ? `<span class="size">${file.size}</span>` : ''}
                     </div>
                 `).join('');
-            }} else {{
+            } else {
                 trackedFilesPanel.classList.remove('visible');
-            }}
-        }}
+            }
+        }
 
-        function createTreeNode(node, parentPath = '') {{
+        function createTreeNode(node, parentPath = '') {
             const div = document.createElement('div');
             div.className = 'tree-node';
 
@@ -349,37 +412,37 @@ def generate_html(tree_data, critical_files, base_url):
             nodeContent.className = 'node-content';
 
             // Construct the full path
-            const currentPath = parentPath ? `${{parentPath}}/${{node.name}}` : node.name;
+            const currentPath = parentPath ? `${parentPath}/${node.name}` : node.name;
 
-            // Apply highlighting if the file is critical
-            if (criticalFiles.includes(currentPath.toLowerCase())) {{
+            // Apply highlighting if the file is critical (flagged by build_tree)
+            if (node.is_critical) {
                 nodeContent.classList.add('highlight-critical');
-            }}
+            }
 
             const hasChildren = node.children && node.children.length > 0;
             
-            if (hasChildren) {{
+            if (hasChildren) {
                 const expander = document.createElement('span');
                 expander.className = 'expander';
                 expander.textContent = '▼';  // Start expanded
-                expander.onclick = () => {{
+                expander.onclick = () => {
                     const childContainer = div.querySelector('.children');
                     const isExpanded = expander.textContent === '▼';
                     expander.textContent = isExpanded ? '▶' : '▼';
                     childContainer.style.display = isExpanded ? 'none' : 'block';
-                }};
+                };
                 nodeContent.appendChild(expander);
-            }} else {{
+            } else {
                 const spacer = document.createElement('span');
                 spacer.style.width = '20px';
                 spacer.style.display = 'inline-block';
                 nodeContent.appendChild(spacer);
-            }}
+            }
 
             const checkbox = document.createElement('div');
             checkbox.className = 'checkbox';
             checkbox.dataset.state = '0';
-            checkbox.onclick = () => {{
+            checkbox.onclick = () => {
                 const currentState = parseInt(checkbox.dataset.state);
                 const newState = (currentState + 1) % 3;
                 checkbox.dataset.state = newState;
@@ -387,7 +450,7 @@ def generate_html(tree_data, critical_files, base_url):
                     (newState === 1 ? 'red-x' : newState === 2 ? 'green-check' : '');
                 checkbox.textContent = newState === 1 ? '❌' : newState === 2 ? '✓' : '';
                 updateTrackedFiles();
-            }};
+            };
             nodeContent.appendChild(checkbox);
 
             const icon = document.createElement('span');
@@ -397,54 +460,135 @@ def generate_html(tree_data, critical_files, base_url):
 
             const nameContainer = document.createElement('a');
             nameContainer.className = 'node-name';
-            // Use the correct base URL here
-            const baseUrl = "{escape(base_url)}";  // Updated base URL
-            nameContainer.href = `${{baseUrl}}/${{currentPath}}`;
+            nameContainer.href = `${baseUrl}/${currentPath}`;
             nameContainer.target = '_blank';
-            nameContainer.innerHTML = hasChildren ? escapeHtml(node.name) : formatFileName(escapeHtml(node.name));
+            const escapedName = escapeHtml(node.name);
+            nameContainer.innerHTML = hasChildren ? escapedName : formatFileName(escapedName);
             nodeContent.appendChild(nameContainer);
 
-            if (node.size) {{
+            // Tracked-panel entry, computed once here instead of read back from the DOM on every click
+            checkbox.trackedFile = {
+                name: escapedName,
+                size: node.size ? `[${node.size}]` : '',
+                path: nameContainer.href,
+                isDirectory: hasChildren
+            };
+
+            if (node.size) {
                 const size = document.createElement('span');
                 size.className = 'size';
-                size.textContent = `[${{node.size}}]`;
+                size.textContent = `[${node.size}]`;
                 nodeContent.appendChild(size);
-            }}
+            }
 
             div.appendChild(nodeContent);
 
-            if (hasChildren) {{
+            if (hasChildren) {
                 const childContainer = document.createElement('div');
                 childContainer.className = 'children';
                 childContainer.style.display = 'block';  // Start expanded
-                node.children.forEach(child => {{
-                    childContainer.appendChild(
-                        createTreeNode(child, currentPath)
-                    );
-                }});
                 div.appendChild(childContainer);
-            }}
+            }
 
             return div;
-        }}
-
-        function escapeHtml(text) {{
-            const map = {{
-                '&': '&amp;',
-                '<': '&lt;',
-                '>': '&gt;',
-                '"': '&quot;',
-                "'": '&#039;'
-            }};
-            return text.replace(/[&<>"']/g, function(m) {{ return map[m]; }});
-        }}
+        }
+
+        function renderTree(root) {
+            // Walk the tree with an explicit stack so deep directory trees cannot overflow the call stack
+            const rootElement = createTreeNode(root);
+            const stack = [[root, rootElement, root.name]];
+            while (stack.length > 0) {
+                const [node, element, currentPath] = stack.pop();
+                if (!node.children) continue;
+                const childContainer = element.querySelector('.children');
+                node.children.forEach(child => {
+                    const childElement = createTreeNode(child, currentPath);
+                    childContainer.appendChild(childElement);
+                    stack.push([child, childElement, currentPath ? `${currentPath}/${child.name}` : child.name]);
+                });
+            }
+            return rootElement;
+        }
+
+        // Built once rather than on every escapeHtml call
+        const htmlEscapes = {
+            '&': '&amp;',
+            '<': '&lt;',
+            '>': '&gt;',
+            '"': '&quot;',
+            "'": '&#039;'
+        };
+        const htmlEscapePattern = /[&<>"']/g;
+        const replaceHtmlEscape = m => htmlEscapes[m];
+
+        function escapeHtml(text) {
+            return text.replace(htmlEscapePattern, replaceHtmlEscape);
+        }
 
         // Initialize the tree
-        document.getElementById('tree-root').appendChild(createTreeNode(treeData));
+        document.getElementById('tree-root').appendChild(renderTree(treeData));
     </script>
 </body>
 </html>"""
 
+def tree_to_json(tree_data):
+    """
+    Serializes the directory tree as compact JSON, keeping non-ASCII names as they are.
+    The tree is walked with an explicit stack because json.dumps recurses once per nesting level
+    and fails on deep paths.
+    """
+    # Quotes and escapes a string exactly as json.dumps does with ensure_ascii=False
+    quote = json.encoder.encode_basestring
+    chunks = []
+    # Holds nodes still to be written, plus the ',' and ']}' strings that go between and after them
+    stack = [tree_data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            chunks.append(item)
+            continue
+        # Same keys, in the same order, as TreeNode.to_dict writes them
+        fields = '"name":' + quote(item['name'])
+        if 'size' in item:
+            fields += ',"size":' + quote(item['size'])
+        if item.get('is_critical'):
+            fields += ',"is_critical":true'
+        children = item.get('children')
+        if children is None:
+            chunks.append(f'{{{fields}}}')
+            continue
+        chunks.append(f'{{{fields},"children":[')
+        stack.append(']}')
+        # Pushed in reverse so the first child is popped, and written, first
+        for index in range(len(children) - 1, -1, -1):
+            stack.append(children[index])
+            if index:
+                stack.append(',')
+    return ''.join(chunks)
+
+def generate_html(tree_data, critical_files, base_url):
+    """
+    Generates an interactive HTML report based on the directory tree data and critical files.
+    The report is yielded section by section so the full document is never held in memory.
+    """
+    # Escape each URL component once; the same strings are reused for link targets and link text
+    escaped_base_url = escape(base_url)
+
+    yield REPORT_HEAD
+    yield REPORT_CSS
+    yield REPORT_SUMMARY_OPEN
+    if critical_files:
+        yield CRITICAL_BOX_OPEN
+        # One chunk per link instead of joining every link into a temporary string first
+        for item in critical_files:
+            path = escape(item['path'])
+            yield f'<a href="{escaped_base_url}/{path}" target="_blank">{path}</a>'
+        yield CRITICAL_BOX_CLOSE
+    yield REPORT_BODY
+    yield tree_to_json(tree_data)
+    yield f';\n        const baseUrl = "{escaped_base_url}";  // Defined once for every node\'s link\n'
+    yield REPORT_SCRIPT
+
 def main():
     """
     Main function to parse feroxbuster results, categorize critical files, build the directory tree,
@@ -459,19 +603,18 @@ def main():
 
     print("Starting to parse feroxbuster results...")
     try:
-        with open(input_file, 'r') as f:
+        base_prefix = base_url.rstrip('/') + '/'
+        with open(input_file, 'rb') as f:
             print(f"Reading {input_file}...")
-            lines = f.readlines()
-
-        files = {}
-        duplicates = 0
-        for line in lines:
-            result = parse_ferox_line(line, base_url + '/')
-            if result:
-                path, size = result
-                if path.lower() in {p.lower() for p in files.keys()}:
-                    duplicates += 1
-                files[path] = size
+            st = os.fstat(f.fileno())
+            if stat.S_ISREG(st.st_mode) and st.st_size:
+                # Scan the mapped file instead of copying it into memory; only matched fields get decoded,
+                # and stray non-UTF-8 bytes must not abort the parse
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    files, duplicates = collect_files(data, base_prefix)
+            else:
+                # Pipes, FIFOs and empty files cannot be mapped, so read them in one call instead
+                files, duplicates = collect_files(f.read(), base_prefix)
 
         print(f"Found {len(files)} files with 200 status code")
         print(f"Removed {duplicates} duplicate entries")
@@ -483,11 +626,10 @@ def main():
         tree = build_tree(files, critical_files)
 
         print("Generating HTML report...")
-        html_output = generate_html(tree, critical_files, base_url)
-
         output_file = 'ferox_report.html'
-        with open(output_file, 'w') as f:
-            f.write(html_output)
+        # The report is written in many small pieces, so give the file a larger buffer than the 8 KiB default
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 17) as f:
+            f.writelines(generate_html(tree, critical_files, base_url))
 
         print(f"\nSuccess! Report generated: {output_file}")
         print(f"Total unique files processed: {len(files)}")